@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""Convert standard bank statement CSVs into import files for each accounting tool."""
+from __future__ import annotations
+
+import argparse
+import csv
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+from validate import (
+    COMPRESSED_OPENERS,
+    CONFIG_DEFAULT,
+    READ_ERRORS,
+    load_config,
+    open_input,
+    positive_int,
+    unreadable_message,
+)
+
+MAPPINGS_DIR = Path(__file__).resolve().parents[1] / "evidence"
+SOFTWARES = ["quickbooks", "xero", "sage", "zoho", "wave", "freshbooks"]
+
+
+class ConversionError(Exception):
+    """Raised when a mapping table or input file can't be converted."""
+
+
+def signed_amount(amount: str, direction: str) -> str:
+    return f"-{amount}" if amount and direction == "debit" else amount
+
+
+def debit_amount(amount: str, direction: str) -> str:
+    return amount if direction == "debit" else ""
+
+
+def credit_amount(amount: str, direction: str) -> str:
+    return amount if direction == "credit" else ""
+
+
+# Transforms that need the row's debit_credit value alongside the source column.
+DIRECTIONAL_TRANSFORMS: Dict[str, Callable[[str, str], str]] = {
+    "signed_amount": signed_amount,
+    "debit_amount": debit_amount,
+    "credit_amount": credit_amount,
+}
+# "date:<strftime pattern>" rewrites transaction dates into the target software's format.
+DATE_TRANSFORM_PREFIX = "date:"
+
+
+def date_formats_from_config(config: Dict[str, object]) -> Tuple[str, ...]:
+    """Every date format any profile accepts, in first-seen order."""
+    formats: Dict[str, None] = {}
+    for profile in config.get("profiles", {}).values():
+        allowed = profile.get("date_format", [])
+        for fmt in [allowed] if isinstance(allowed, str) else allowed:
+            formats[fmt] = None
+    return tuple(formats)
+
+
+def date_transform(output_format: str, input_formats: Iterable[str]) -> Callable[[str, str], str]:
+    input_formats = list(input_formats)
+
+    def transform(value: str, direction: str) -> str:
+        if not value:
+            return value
+        for fmt in input_formats:
+            try:
+                return datetime.strptime(value, fmt).strftime(output_format)
+            except ValueError:
+                continue
+        raise ConversionError(f"date '{value}' isn’t in a recognised format. Run validate.py on the file first.")
+
+    return transform
+
+
+def check_transform(spec: str) -> bool:
+    if spec.startswith(DATE_TRANSFORM_PREFIX):
+        return bool(spec[len(DATE_TRANSFORM_PREFIX):])
+    return not spec or spec in DIRECTIONAL_TRANSFORMS
+
+
+@dataclass(frozen=True)
+class MappingStep:
+    source_column: str
+    target_field: str
+    transform: str = ""
+
+
+@dataclass(frozen=True)
+class ConversionPlan:
+    software: str
+    steps: Tuple[MappingStep, ...]
+    optional_columns: Tuple[str, ...] = ()
+    date_formats: Tuple[str, ...] = ()
+
+    @property
+    def target_fields(self) -> List[str]:
+        return [step.target_field for step in self.steps]
+
+    def resolve(self, spec: str) -> Callable[[str, str], str] | None:
+        if spec.startswith(DATE_TRANSFORM_PREFIX):
+            return date_transform(spec[len(DATE_TRANSFORM_PREFIX):], self.date_formats)
+        return DIRECTIONAL_TRANSFORMS.get(spec)
+
+    def bind(self, header: Sequence[str]) -> Callable[[int, Sequence[str]], List[str]]:
+        """Resolve column positions once so each row is a plain list projection."""
+        positions = {name.strip(): idx for idx, name in enumerate(header)}
+        needed = {step.source_column for step in self.steps if step.source_column not in self.optional_columns}
+        directional = any(step.transform in DIRECTIONAL_TRANSFORMS for step in self.steps)
+        if directional:
+            needed.add("debit_credit")
+        missing = sorted(needed - positions.keys())
+        if missing:
+            raise ConversionError(
+                f"Missing column(s) for {self.software}: {', '.join(missing)}. Match the headers from the sample files exactly."
+            )
+
+        direction_idx = positions.get("debit_credit", -1)
+        amount_idx = positions.get("amount", -1)
+        plan = [(positions.get(step.source_column, -1), self.resolve(step.transform)) for step in self.steps]
+
+        def project(line: int, row: Sequence[str]) -> List[str]:
+            width = len(row)
+            direction = row[direction_idx].strip().lower() if 0 <= direction_idx < width else ""
+            if directional:
+                # Signing an amount that already carries a sign, or has no direction, would flip money in and out.
+                amount = row[amount_idx].strip() if 0 <= amount_idx < width else ""
+                if amount[:1] in ("-", "+") or direction not in ("debit", "credit"):
+                    raise ConversionError(
+                        f"Row {line}: amount '{amount}' with debit_credit '{direction}' can’t be signed safely. "
+                        "Run repair.py or validate.py on the file first."
+                    )
+            out = []
+            for idx, transform in plan:
+                value = row[idx].strip() if 0 <= idx < width else ""
+                if transform:
+                    try:
+                        value = transform(value, direction)
+                    except ConversionError as exc:
+                        raise ConversionError(f"Row {line}: {exc}") from None
+                out.append(value)
+            return out
+
+        return project
+
+
+def load_mapping(software: str, mappings_dir: Path = MAPPINGS_DIR) -> List[MappingStep]:
+    path = mappings_dir / f"{software}-mapping.csv"
+    try:
+        with path.open(newline="", encoding="utf-8-sig") as handle:
+            rows = list(csv.DictReader(handle))
+    except FileNotFoundError:
+        raise ConversionError(f"No mapping table found at {path}. Download the latest repo bundle.") from None
+
+    steps = []
+    for row in rows:
+        transform = (row.get("transform") or "").strip()
+        if not check_transform(transform):
+            raise ConversionError(f"{path.name}: unknown transform '{transform}' for {row['target_field']}")
+        steps.append(MappingStep(row["source_column"].strip(), row["target_field"].strip(), transform))
+    if not steps:
+        raise ConversionError(f"{path.name} has no mapping rows.")
+    return steps
+
+
+def compile_plan(software: str, config: Dict[str, object], mappings_dir: Path = MAPPINGS_DIR) -> ConversionPlan:
+    return ConversionPlan(
+        software=software,
+        steps=tuple(load_mapping(software, mappings_dir)),
+        optional_columns=tuple(config.get("optional_columns", [])),
+        date_formats=date_formats_from_config(config),
+    )
+
+
+def write_error_message(target: Path, exc: OSError) -> str:
+    return f"We couldn’t write {target} ({exc.strerror or exc}). Check the --output-dir folder exists, is writable and has free space."
+
+
+def convert_file(plan: ConversionPlan, source: Path, target: Path) -> int:
+    """Stream one CSV through the plan row by row; returns the number of rows written."""
+    count = 0
+    written = complete = False
+    try:
+        with open_input(source) as src:
+            reader = csv.reader(src)
+            header = next(reader, None)
+            if header is None:
+                raise ConversionError("The CSV is empty. Export a fresh file or download a sample from the Releases tab.")
+            project = plan.bind(header)
+            try:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                dst = target.open("w", newline="", encoding="utf-8")
+            except OSError as exc:
+                raise ConversionError(write_error_message(target, exc)) from None
+            written = True
+            with dst:
+                writer = csv.writer(dst)
+                writer.writerow(plan.target_fields)
+                for line, row in enumerate(reader, start=2):
+                    if not any(cell.strip() for cell in row):
+                        continue
+                    converted = project(line, row)
+                    try:
+                        writer.writerow(converted)
+                    except OSError as exc:
+                        raise ConversionError(write_error_message(target, exc)) from None
+                    count += 1
+        complete = True
+    except ConversionError as exc:
+        raise ConversionError(f"{source}: {exc}") from None
+    except FileNotFoundError:
+        raise ConversionError(f"We couldn’t find {source}. Check the path and try again.") from None
+    except READ_ERRORS as exc:
+        raise ConversionError(f"{source}: {unreadable_message(exc)}") from None
+    finally:
+        if written and not complete:
+            target.unlink(missing_ok=True)  # Don't leave half-converted files behind
+    return count
+
+
+def output_path_for(source: Path, software: str, output_dir: Path | None) -> Path:
+    folder = output_dir if output_dir is not None else source.parent
+    base = source.with_suffix("") if source.suffix.lower() in COMPRESSED_OPENERS else source
+    return folder / f"{base.stem}__{software}.csv"
+
+
+def convert_batch(
+    plan: ConversionPlan, jobs: List[Tuple[Path, Path]], workers: int | None = None
+) -> List[Tuple[Path, Path, int]]:
+    """Convert several files, spreading them across processes when there's more than one."""
+    clashes = [str(target) for target, count in Counter(target.resolve() for _, target in jobs).items() if count > 1]
+    if clashes:
+        raise ConversionError(
+            f"Several inputs would be written to {', '.join(clashes)}. Rename one of them or convert them into separate --output-dir folders."
+        )
+    if len(jobs) <= 1 or workers == 1:
+        return [(source, target, convert_file(plan, source, target)) for source, target in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [(source, target, pool.submit(convert_file, plan, source, target)) for source, target in jobs]
+        return [(source, target, future.result()) for source, target, future in futures]
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Convert standard bank statement CSVs into the import layout for your accounting software.",
+    )
+    parser.add_argument("csv_paths", nargs="+", help="One or more standard CSV files to convert")
+    parser.add_argument("--software", required=True, choices=SOFTWARES, help="Target accounting software")
+    parser.add_argument("--output-dir", help="Folder for converted files (defaults to next to each input)")
+    parser.add_argument("--jobs", type=positive_int, default=None, help="Parallel workers for batches (defaults to CPU count)")
+    parser.add_argument("--mappings", default=str(MAPPINGS_DIR), help="Folder holding the {software}-mapping.csv tables")
+    parser.add_argument("--config", default=str(CONFIG_DEFAULT), help="Override the config file path if needed")
+
+    args = parser.parse_args(argv)
+    config = load_config(Path(args.config))
+    output_dir = Path(args.output_dir) if args.output_dir else None
+
+    try:
+        plan = compile_plan(args.software, config, Path(args.mappings))
+        jobs = [(Path(raw), output_path_for(Path(raw), args.software, output_dir)) for raw in args.csv_paths]
+        results = convert_batch(plan, jobs, args.jobs)
+    except ConversionError as exc:
+        sys.exit(str(exc))
+
+    for source, target, count in results:
+        print(f"✅ {source} → {target} ({count} rows)")
+
+
+if __name__ == "__main__":
+    main()
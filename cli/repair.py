@@ -0,0 +1,489 @@
+#!/usr/bin/env python3
+"""Fix common export problems in one pass and split the result into one CSV per currency."""
+from __future__ import annotations
+
+import argparse
+import csv
+import re
+import sys
+from collections import Counter, OrderedDict
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from typing import IO, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from validate import (
+    COMPRESSED_OPENERS,
+    CONFIG_DEFAULT,
+    CTA_LINK,
+    MAX_DUPLICATE_WINDOW,
+    READ_ERRORS,
+    StreamValidator,
+    ValidationIssue,
+    duplicate_window_days,
+    duplicate_window_for,
+    load_config,
+    open_input,
+    unreadable_message,
+)
+
+BOM = "\ufeff"
+# Descriptions that statement PDFs use for totals and footers. A matching row is only
+# dropped when it also lacks what a real transaction has (see looks_like_summary).
+SUMMARY_DESCRIPTION = re.compile(
+    r"^(sub)?totals?\b|^closing balance\b|^balance (carried|brought) forward\b|^page \d+ of \d+",
+    re.IGNORECASE,
+)
+# unique_id prefixes that exporters give to non-transaction lines; override with --summary-id-prefix.
+DEFAULT_SUMMARY_ID_PREFIXES = ("FOOTER-", "SUMMARY-", "TOTAL-")
+CURRENCY_CODE = re.compile(r"^[A-Z]{3}$")
+# Currency markers stripped from amounts: ISO codes and symbols such as $, C$, US$, € or £.
+CURRENCY_PREFIX = re.compile(r"^(?:[A-Z]{3}\s*|[A-Z]{0,2}[$€£¥]\s*)")
+CURRENCY_SUFFIX = re.compile(r"(?:\s*[A-Z]{3}|\s*[$€£¥])$")
+INVALID_CURRENCY = "invalid-currency"
+# Rows are spread across one file per currency, but only this many stay open at once.
+MAX_OPEN_OUTPUTS = 32
+# How many dropped rows the summary lists individually.
+MAX_DROPPED_SHOWN = 50
+
+Row = Dict[str, str]
+NumberedRow = Tuple[int, Row]
+Stage = Callable[[Iterable[NumberedRow]], Iterator[NumberedRow]]
+# (repaired file, rows written, issues found, note on which profile checked it)
+RepairResult = Tuple[Path, int, List[ValidationIssue], str]
+
+
+class RepairError(Exception):
+    """Raised when the input can't be read or the repaired files can't be written."""
+
+
+def strip_bom(stats: Counter) -> Stage:
+    """Remove stray byte-order marks and padding that survive copy-pasted or concatenated exports."""
+
+    def stage(rows: Iterable[NumberedRow]) -> Iterator[NumberedRow]:
+        for line, row in rows:
+            cleaned = {key: (value or "").replace(BOM, "").strip() for key, value in row.items() if key is not None}
+            if any(BOM in (value or "") for value in row.values() if isinstance(value, str)):
+                stats["bom_removed"] += 1
+            yield line, cleaned
+
+    return stage
+
+
+def looks_like_summary(row: Row, id_prefixes: Sequence[str]) -> bool:
+    """A totals-style description plus no real transaction id, date or balance."""
+    if not SUMMARY_DESCRIPTION.match(row.get("description", "")):
+        return False
+    unique_id = row.get("unique_id", "").upper()
+    return (
+        not unique_id
+        or unique_id.startswith(tuple(prefix.upper() for prefix in id_prefixes))
+        or not row.get("transaction_date", "")
+        or not row.get("balance", "")
+    )
+
+
+def drop_summary_rows(
+    stats: Counter, dropped: List[Tuple[int, str]], fieldnames: List[str], id_prefixes: Sequence[str]
+) -> Stage:
+    """Skip footer totals, subtotals and header lines repeated mid-file, noting each one for the summary."""
+
+    def stage(rows: Iterable[NumberedRow]) -> Iterator[NumberedRow]:
+        for line, row in rows:
+            if all(row.get(name, "") == name for name in fieldnames):
+                stats["repeated_headers_dropped"] += 1
+                continue
+            if looks_like_summary(row, id_prefixes):
+                stats["summary_rows_dropped"] += 1
+                if len(dropped) < MAX_DROPPED_SHOWN:
+                    dropped.append((line, row.get("description", "")))
+                continue
+            if not any(row.values()):
+                continue
+            yield line, row
+
+    return stage
+
+
+def number_pattern(decimal_separator: str, thousands_separator: str) -> re.Pattern:
+    """Digits with optional thousands grouping (the profile's separator or a space) and up to two decimals."""
+    decimal_mark, group_mark = re.escape(decimal_separator), re.escape(thousands_separator)
+    return re.compile(
+        rf"^(?P<whole>\d+|\d{{1,3}}(?P<group>[{group_mark} \u00a0])\d{{3}}(?:(?P=group)\d{{3}})*)"
+        rf"(?:{decimal_mark}(?P<fraction>\d{{1,2}}))?$"
+    )
+
+
+def parse_amount(raw: str, pattern: re.Pattern) -> Optional[Tuple[Decimal, bool]]:
+    """Read an amount with currency symbols and signs around it; returns (absolute value, was it negative).
+
+    Anything else, such as scientific notation, more than two decimals or stray text,
+    returns None so the row reaches the validator unchanged instead of being guessed at.
+    """
+    text = raw.strip()
+    negative = False
+    if text.startswith("(") and text.endswith(")"):
+        negative, text = True, text[1:-1].strip()
+    if text.endswith("-"):
+        negative, text = True, text[:-1].rstrip()
+    if text[:1] in ("-", "+"):  # sign before the symbol: -$12.00
+        negative, text = negative or text[0] == "-", text[1:].lstrip()
+    text = CURRENCY_SUFFIX.sub("", CURRENCY_PREFIX.sub("", text))
+    if text[:1] in ("-", "+"):  # sign after the symbol: $-12.00
+        negative, text = negative or text[0] == "-", text[1:]
+
+    match = pattern.match(text)
+    if not match:
+        return None
+    whole = re.sub(r"\D", "", match.group("whole"))
+    try:
+        value = Decimal(f"{whole}.{match.group('fraction') or '0'}").quantize(Decimal("0.01"))
+    except InvalidOperation:
+        return None  # Too many digits to hold exactly
+    return value, negative
+
+
+def normalise_amounts(stats: Counter, decimal_separator: str = ".", thousands_separator: str = ",") -> Stage:
+    """Rewrite amounts to the amount_pattern form and let debit_credit carry the direction."""
+    pattern = number_pattern(decimal_separator, thousands_separator)
+
+    def stage(rows: Iterable[NumberedRow]) -> Iterator[NumberedRow]:
+        for line, row in rows:
+            raw = row.get("amount", "")
+            parsed = parse_amount(raw, pattern) if raw else None
+            if parsed is None:
+                yield line, row  # Left for the validator to report
+                continue
+            value, negative = parsed
+            amount = f"{value}"
+            if amount != raw:
+                stats["amounts_normalised"] += 1
+                row["amount"] = amount
+            if negative and row.get("debit_credit", "").lower() != "debit":
+                stats["signs_flipped"] += 1
+                row["debit_credit"] = "debit"
+            yield line, row
+
+    return stage
+
+
+def fill_currency(stats: Counter, default: str) -> Stage:
+    """Upper-case currency codes and fill blanks so every row lands in a currency file."""
+
+    def stage(rows: Iterable[NumberedRow]) -> Iterator[NumberedRow]:
+        for line, row in rows:
+            currency = row.get("currency", "").upper()
+            if not currency and default:
+                stats["currency_filled"] += 1
+                currency = default
+            row["currency"] = currency
+            yield line, row
+
+    return stage
+
+
+def run_pipeline(rows: Iterable[NumberedRow], stages: Iterable[Stage]) -> Iterator[NumberedRow]:
+    for stage in stages:
+        rows = stage(rows)
+    return iter(rows)
+
+
+def write_error_message(path: Path, exc: OSError) -> str:
+    return f"We couldn’t write {path} ({exc.strerror or exc}). Check the output folder exists, is writable and has free space."
+
+
+class CurrencySplitter:
+    """Writes each row to the file for its currency and validates it on the way through.
+
+    Only three-letter codes get their own file; anything else goes to a single
+    invalid-currency file. At most MAX_OPEN_OUTPUTS files are open at once: the least
+    recently used one is closed and reopened for appending when its currency comes back.
+
+    Each file is checked against currency_profiles[currency] when given, otherwise against
+    profile. A currency that profile doesn't allow skips only CSV022, since splitting the
+    file is exactly what that check asks for, and the result carries a note saying so.
+    """
+
+    def __init__(
+        self,
+        output_dir: Path,
+        stem: str,
+        fieldnames: List[str],
+        config: Dict[str, object],
+        profile: Dict[str, object],
+        duplicate_window: Optional[int] = None,
+        currency_profiles: Optional[Dict[str, Dict[str, object]]] = None,
+    ) -> None:
+        self.output_dir = output_dir
+        self.stem = stem
+        self.fieldnames = fieldnames
+        self.config = config
+        self.profile = profile
+        self.duplicate_window = duplicate_window
+        self.currency_profiles = currency_profiles or {}
+        self.outputs: Dict[str, Tuple[Path, StreamValidator, str]] = {}
+        self.open_files: "OrderedDict[str, Tuple[IO[str], csv.DictWriter]]" = OrderedDict()
+
+    def _profile_for(self, key: str) -> Tuple[Dict[str, object], str]:
+        if key in self.currency_profiles:
+            profile = self.currency_profiles[key]
+            return profile, f"Checked against {profile.get('label', key)}."
+        if key == INVALID_CURRENCY or key in self.profile.get("currency", []):
+            return self.profile, ""
+        note = (
+            f"{key} isn’t a {self.profile.get('label', 'profile')} currency, so the currency check (CSV022) was skipped. "
+            f"Add --profile-for {key}=<profile> to check this file against the profile you’ll import it with."
+        )
+        return dict(self.profile, currency=[key]), note
+
+    def _writer_for(self, key: str) -> csv.DictWriter:
+        if key in self.open_files:
+            self.open_files.move_to_end(key)
+            return self.open_files[key][1]
+        if len(self.open_files) >= MAX_OPEN_OUTPUTS:
+            oldest_key, (oldest, _) = self.open_files.popitem(last=False)
+            self._close(oldest_key, oldest)
+
+        is_new = key not in self.outputs
+        path = self.output_dir / f"{self.stem}__{key}.csv" if is_new else self.outputs[key][0]
+        if is_new:
+            # Register before opening so discard() also removes a file that fails mid-header.
+            profile, note = self._profile_for(key)
+            self.outputs[key] = (path, StreamValidator(self.config, profile, self.duplicate_window), note)
+        try:
+            handle = path.open("w" if is_new else "a", newline="", encoding="utf-8")
+            writer = csv.DictWriter(handle, fieldnames=self.fieldnames, extrasaction="ignore")
+            self.open_files[key] = (handle, writer)
+            if is_new:
+                writer.writeheader()
+        except OSError as exc:
+            raise RepairError(write_error_message(path, exc)) from None
+        return writer
+
+    def _close(self, key: str, handle: IO[str]) -> None:
+        try:
+            handle.close()
+        except OSError as exc:
+            raise RepairError(write_error_message(self.outputs[key][0], exc)) from None
+
+    def write(self, row: Row) -> None:
+        currency = row.get("currency", "")
+        key = currency if CURRENCY_CODE.match(currency) else INVALID_CURRENCY
+        writer = self._writer_for(key)
+        try:
+            writer.writerow(row)
+        except OSError as exc:
+            raise RepairError(write_error_message(self.outputs[key][0], exc)) from None
+        validator = self.outputs[key][1]
+        validator.add(validator.count + 2, row)  # +2 for header row
+
+    def close(self) -> None:
+        while self.open_files:
+            key, (handle, _) = self.open_files.popitem()
+            self._close(key, handle)
+
+    def discard(self) -> None:
+        """Close and delete every file written so far, so a failed run leaves nothing half-done."""
+        for handle, _ in self.open_files.values():
+            try:
+                handle.close()
+            except OSError:
+                pass
+        self.open_files.clear()
+        for path, _, _ in self.outputs.values():
+            path.unlink(missing_ok=True)
+
+    def results(self) -> List[RepairResult]:
+        return [
+            (path, validator.count, validator.issues(self.fieldnames), note)
+            for path, validator, note in sorted(self.outputs.values(), key=lambda item: item[0].name)
+        ]
+
+
+def repair_file(
+    source: Path,
+    output_dir: Path,
+    config: Dict[str, object],
+    profile: Dict[str, object],
+    default_currency: str = "",
+    duplicate_window: Optional[int] = None,
+    summary_id_prefixes: Sequence[str] = DEFAULT_SUMMARY_ID_PREFIXES,
+    decimal_separator: str = ".",
+    thousands_separator: str = ",",
+    currency_profiles: Optional[Dict[str, Dict[str, object]]] = None,
+) -> Tuple[Counter, List[Tuple[int, str]], List[RepairResult]]:
+    stats: Counter = Counter()
+    dropped: List[Tuple[int, str]] = []
+    base = source.with_suffix("") if source.suffix.lower() in COMPRESSED_OPENERS else source
+    splitter: Optional[CurrencySplitter] = None
+    try:
+        with open_input(source) as handle:
+            reader = csv.DictReader(handle)
+            if reader.fieldnames is None:
+                raise RepairError("The CSV is empty. Export a fresh file or download a sample from the Releases tab.")
+            fieldnames = [name.replace(BOM, "").strip() for name in reader.fieldnames]
+            reader.fieldnames = fieldnames
+            output_fields = fieldnames if "currency" in fieldnames else fieldnames + ["currency"]
+
+            try:
+                output_dir.mkdir(parents=True, exist_ok=True)
+            except OSError as exc:
+                raise RepairError(write_error_message(output_dir, exc)) from None
+            splitter = CurrencySplitter(
+                output_dir, f"{base.stem}__repaired", output_fields, config, profile, duplicate_window, currency_profiles
+            )
+            stages = [
+                strip_bom(stats),
+                drop_summary_rows(stats, dropped, fieldnames, summary_id_prefixes),
+                normalise_amounts(stats, decimal_separator, thousands_separator),
+                fill_currency(stats, default_currency),
+            ]
+            for _, row in run_pipeline(enumerate(reader, start=2), stages):  # +2 for header row
+                splitter.write(row)
+                stats["rows_written"] += 1
+            splitter.close()
+    except RepairError as exc:
+        error = str(exc)
+    except FileNotFoundError:
+        error = f"We couldn’t find {source}. Drag & drop the file onto this script or run it again with the correct path."
+    except READ_ERRORS as exc:
+        error = unreadable_message(exc)
+    else:
+        return stats, dropped, splitter.results()
+
+    if splitter is not None:
+        splitter.discard()
+    raise RepairError(error)
+
+
+def summarise_repair(
+    stats: Counter,
+    dropped: List[Tuple[int, str]],
+    results: List[RepairResult],
+    profile_label: str,
+) -> None:
+    print("🛠️ Repairs applied:")
+    print(f"  • Amounts rewritten to 1234.56 style: {stats['amounts_normalised']}")
+    print(f"  • Negative amounts switched to debit: {stats['signs_flipped']}")
+    print(f"  • Summary or footer rows removed: {stats['summary_rows_dropped']}")
+    for line, description in dropped:
+        print(f"      – input row {line}: {description}")
+    if stats["summary_rows_dropped"] > len(dropped):
+        print(f"      – …and {stats['summary_rows_dropped'] - len(dropped)} more")
+    print(f"  • Repeated header rows removed: {stats['repeated_headers_dropped']}")
+    print(f"  • Rows with a stray BOM cleaned: {stats['bom_removed']}")
+    print(f"  • Blank currencies filled in: {stats['currency_filled']}")
+    print("")
+    if not results:
+        print("No transactions were left after removing summary rows. Check the export includes the statement lines.")
+        sys.exit(1)
+
+    print(f"Profile: {profile_label}")
+    failing = 0
+    for path, count, issues, note in results:
+        print(f"{'⚠️' if issues else '✅'} {path} ({count} rows)")
+        if note:
+            print(f"    ℹ️ {note}")
+        for issue in issues:
+            print(f"    • [{issue.code}] {issue.message}\n        ↳ {issue.hint}")
+        failing += bool(issues)
+    print("")
+    if not failing:
+        print("✅ All good! Every repaired file matches the ConvertMyStatements checks.")
+        if dropped:
+            print("Double-check that the removed rows listed above really were totals or footers.")
+        return
+
+    print(f"⚠️ {failing} of {len(results)} file(s) still need a manual fix before importing.")
+    print("Use the hosted validator for step-by-step guidance:")
+    print(CTA_LINK)
+
+    # Exit with non-zero code for automation contexts
+    sys.exit(1)
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Repair a bank statement CSV in one pass and split it into one file per currency.",
+    )
+    parser.add_argument("csv_path", help="CSV to repair (.csv, .csv.gz, .csv.bz2 or .csv.xz)")
+    parser.add_argument("--profile", default="quickbooks-us", help="Profile used to check the repaired files")
+    parser.add_argument(
+        "--profile-for",
+        action="append",
+        default=[],
+        metavar="CUR=PROFILE",
+        help="Check one currency's file against another profile, e.g. CAD=quickbooks-ca; repeat for several",
+    )
+    parser.add_argument("--output-dir", help="Folder for repaired files (defaults to next to the input)")
+    parser.add_argument("--currency", default="", help="Currency for rows that leave it blank (defaults to the profile's, if it has one)")
+    parser.add_argument(
+        "--decimal-separator",
+        choices=[".", ","],
+        help="Decimal mark used in the input amounts (defaults to the profile’s); the other mark is read as thousands",
+    )
+    parser.add_argument("--config", default=str(CONFIG_DEFAULT), help="Override the config file path if needed")
+    parser.add_argument(
+        "--check-duplicates",
+        action="store_true",
+        help="Also flag rows with the same date, amount, debit/credit and description (CSV011)",
+    )
+    parser.add_argument(
+        "--duplicate-window",
+        type=duplicate_window_days,
+        default=None,
+        help=f"With --check-duplicates, also flag look-alikes up to this many days apart (0-{MAX_DUPLICATE_WINDOW}, defaults to same day only)",
+    )
+    parser.add_argument(
+        "--summary-id-prefix",
+        action="append",
+        help=f"unique_id prefix your bank uses for total/footer lines; repeat for several (defaults to {', '.join(DEFAULT_SUMMARY_ID_PREFIXES)})",
+    )
+
+    args = parser.parse_args(argv)
+    config = load_config(Path(args.config))
+    profiles = config.get("profiles", {})
+    if args.profile not in profiles:
+        available = ", ".join(sorted(profiles.keys()))
+        sys.exit(f"Unknown profile '{args.profile}'. Available options: {available}")
+
+    profile = profiles[args.profile]
+    currency_profiles = {}
+    for raw in args.profile_for:
+        currency, _, key = raw.partition("=")
+        currency = currency.strip().upper()
+        if not CURRENCY_CODE.match(currency) or key.strip() not in profiles:
+            available = ", ".join(sorted(profiles.keys()))
+            sys.exit(f"--profile-for expects CUR=PROFILE, like CAD=quickbooks-ca, got '{raw}'. Available profiles: {available}")
+        currency_profiles[currency] = profiles[key.strip()]
+    source = Path(args.csv_path)
+    output_dir = Path(args.output_dir) if args.output_dir else source.parent
+    profile_currencies = profile.get("currency", [])
+    default_currency = args.currency.upper() or (profile_currencies[0] if len(profile_currencies) == 1 else "")
+    id_prefixes = tuple(args.summary_id_prefix) if args.summary_id_prefix else DEFAULT_SUMMARY_ID_PREFIXES
+    if args.decimal_separator:
+        decimal_separator = args.decimal_separator
+        thousands_separator = "." if decimal_separator == "," else ","
+    else:
+        decimal_separator = profile.get("decimal_separator", ".")
+        thousands_separator = profile.get("thousands_separator", ",")
+
+    try:
+        stats, dropped, results = repair_file(
+            source,
+            output_dir,
+            config,
+            profile,
+            default_currency,
+            duplicate_window_for(args),
+            id_prefixes,
+            decimal_separator,
+            thousands_separator,
+            currency_profiles,
+        )
+    except RepairError as exc:
+        sys.exit(str(exc))
+    summarise_repair(stats, dropped, results, profile.get("label", args.profile))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,17 +3,34 @@
 from __future__ import annotations
 
 import argparse
+import bz2
 import csv
+import gzip
+import io
 import json
+import lzma
+import re
 import sys
-from collections import Counter
+import zipfile
+import zlib
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from decimal import Decimal, InvalidOperation
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from typing import IO, Any, Dict, Iterable, List, Optional, Tuple
 
 CONFIG_DEFAULT = Path(__file__).resolve().parents[1] / "schema" / "validator-config.json"
 CTA_LINK = "https://www.convertmystatements.com/specs/bank-statement-csv#validator?utm_source=github&utm_medium=repo&utm_campaign=bank_statement_csv_spec"
 
+# Compressed single-file uploads are decompressed on the fly while reading.
+COMPRESSED_OPENERS = {".gz": gzip.open, ".bz2": bz2.open, ".xz": lzma.open}
+# Raised by the decompressors themselves when a .gz/.bz2/.xz file or zip member is corrupt or cut short.
+DECOMPRESSION_ERRORS = (EOFError, zlib.error, lzma.LZMAError, zipfile.BadZipFile, gzip.BadGzipFile)
+READ_ERRORS = (UnicodeDecodeError, OSError) + DECOMPRESSION_ERRORS
+# Each row is looked up once per day in the window, so keep it to about a statement month.
+MAX_DUPLICATE_WINDOW = 31
+
 
 class ValidationIssue:
     def __init__(self, code: str, message: str, hint: str) -> None:
@@ -25,6 +42,26 @@ class ValidationIssue:
         return f"{self.message} — {self.hint}"
 
 
+def positive_int(raw: str) -> int:
+    try:
+        value = int(raw)
+    except ValueError:
+        value = 0
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"expected a whole number of 1 or more, got '{raw}'")
+    return value
+
+
+def duplicate_window_days(raw: str) -> int:
+    try:
+        value = int(raw)
+    except ValueError:
+        value = -1
+    if not 0 <= value <= MAX_DUPLICATE_WINDOW:
+        raise argparse.ArgumentTypeError(f"expected a number of days from 0 to {MAX_DUPLICATE_WINDOW}, got '{raw}'")
+    return value
+
+
 def load_config(path: Path) -> Dict[str, Any]:
     try:
         return json.loads(path.read_text())
@@ -32,24 +69,41 @@ def load_config(path: Path) -> Dict[str, Any]:
         sys.exit(f"Config file not found at {path}. Download the latest repo bundle or run from the project root.")
 
 
-def read_csv(path: Path) -> List[Dict[str, str]]:
-    try:
-        with path.open(newline="", encoding="utf-8-sig") as handle:
-            reader = csv.DictReader(handle)
-            rows = list(reader)
-    except FileNotFoundError:
-        sys.exit(f"We couldn’t find {path}. Drag & drop the file onto this script or run it again with the correct path.")
-    except UnicodeDecodeError:
-        sys.exit("The file isn’t UTF-8. Re-save it as 'CSV UTF-8 (Comma delimited)' and try again.")
+def open_input(path: Path) -> IO[str]:
+    """Open a CSV as text, streaming through gzip, bz2 or xz when the extension says so."""
+    opener = COMPRESSED_OPENERS.get(path.suffix.lower())
+    if opener:
+        return opener(path, "rt", newline="", encoding="utf-8-sig")
+    return path.open(newline="", encoding="utf-8-sig")
 
-    if not rows:
-        sys.exit("The CSV is empty. Export a fresh file or download a sample from the Releases tab.")
 
-    return rows
+def open_member(archive: zipfile.ZipFile, member: str) -> IO[str]:
+    """Stream a single zip member as text without extracting it to disk."""
+    return io.TextIOWrapper(archive.open(member), newline="", encoding="utf-8-sig")
+
 
+def list_csv_members(path: Path) -> List[str]:
+    with zipfile.ZipFile(path) as archive:
+        return sorted(
+            info.filename for info in archive.infolist() if not info.is_dir() and info.filename.lower().endswith(".csv")
+        )
+
+
+def unreadable_message(exc: BaseException) -> str:
+    if isinstance(exc, UnicodeDecodeError):
+        return "The file isn’t UTF-8. Re-save it as 'CSV UTF-8 (Comma delimited)' and try again."
+    # bz2 reports corrupt data as a bare OSError with no errno, unlike real file-system errors.
+    if isinstance(exc, DECOMPRESSION_ERRORS) or (isinstance(exc, OSError) and exc.errno is None):
+        return "The compressed file is damaged or incomplete. Download or export it again and re-run the check."
+    if isinstance(exc, IsADirectoryError):
+        return "That path is a folder, not a CSV. Pick the CSV file inside it and try again."
+    if isinstance(exc, PermissionError):
+        return "We don’t have permission to read the file. Copy it somewhere you can open it, or ask your IT team for access."
+    return f"We couldn’t read the file ({getattr(exc, 'strerror', None) or exc}). Check the path and try again."
 
-def ensure_columns(rows: List[Dict[str, str]], config: Dict[str, Any]) -> List[ValidationIssue]:
-    header = rows[0].keys()
+
+def check_columns(header: Iterable[str], config: Dict[str, Any]) -> List[ValidationIssue]:
+    header = list(header)
     issues: List[ValidationIssue] = []
     missing = [col for col in config["required_columns"] if col not in header]
     if missing:
@@ -63,105 +117,72 @@ def ensure_columns(rows: List[Dict[str, str]], config: Dict[str, Any]) -> List[V
     return issues
 
 
-def validate_dates(rows: List[Dict[str, str]], allowed_formats: Iterable[str]) -> List[ValidationIssue]:
-    issues: List[ValidationIssue] = []
-    for idx, row in enumerate(rows, start=2):  # +2 for header row
-        raw_date = row.get("transaction_date", "").strip()
-        if not raw_date:
-            issues.append(
-                ValidationIssue(
-                    "CSV002",
-                    f"Row {idx}: transaction_date is blank",
-                    "Fill every date. Use the bank statement’s original date format."
-                )
-            )
+def check_date(idx: int, row: Dict[str, str], allowed_formats: Iterable[str]) -> Optional[ValidationIssue]:
+    raw_date = row.get("transaction_date", "").strip()
+    if not raw_date:
+        return ValidationIssue(
+            "CSV002",
+            f"Row {idx}: transaction_date is blank",
+            "Fill every date. Use the bank statement’s original date format."
+        )
+    for fmt in allowed_formats:
+        try:
+            datetime.strptime(raw_date, fmt)
+            return None
+        except ValueError:
             continue
-        parsed = False
-        for fmt in allowed_formats:
-            try:
-                datetime.strptime(raw_date, fmt)
-                parsed = True
-                break
-            except ValueError:
-                continue
-        if not parsed:
-            display = " or ".join(fmt.replace("%Y", "YYYY").replace("%m", "MM").replace("%d", "DD") for fmt in allowed_formats)
-            issues.append(
-                ValidationIssue(
-                    "CSV004",
-                    f"Row {idx}: transaction_date '{raw_date}' doesn't match {display}",
-                    "Align the date format with the sample for your software."
-                )
-            )
-    return issues
-
+    display = " or ".join(fmt.replace("%Y", "YYYY").replace("%m", "MM").replace("%d", "DD") for fmt in allowed_formats)
+    return ValidationIssue(
+        "CSV004",
+        f"Row {idx}: transaction_date '{raw_date}' doesn't match {display}",
+        "Align the date format with the sample for your software."
+    )
 
-def validate_amounts(rows: List[Dict[str, str]], pattern: str, decimal_separator: str) -> List[ValidationIssue]:
-    import re
 
-    regex = re.compile(pattern)
-    issues: List[ValidationIssue] = []
-    for idx, row in enumerate(rows, start=2):
-        amount = row.get("amount", "").strip()
-        if not amount:
-            issues.append(
-                ValidationIssue(
-                    "CSV005",
-                    f"Row {idx}: amount is blank",
-                    "Populate every amount. Use positive numbers only; debit/credit decides the direction."
-                )
-            )
-            continue
-        if decimal_separator == ",":
-            candidate = amount.replace(".", "").replace(",", ".")
-        else:
-            candidate = amount
-        if not regex.match(candidate):
-            issues.append(
-                ValidationIssue(
-                    "CSV006",
-                    f"Row {idx}: amount '{amount}' is not formatted correctly",
-                    f"Use two decimal places (e.g., 1234{decimal_separator}56) and remove currency symbols."
-                )
-            )
-    return issues
+def check_amount(idx: int, row: Dict[str, str], regex: re.Pattern, decimal_separator: str) -> Optional[ValidationIssue]:
+    amount = row.get("amount", "").strip()
+    if not amount:
+        return ValidationIssue(
+            "CSV005",
+            f"Row {idx}: amount is blank",
+            "Populate every amount. Use positive numbers only; debit/credit decides the direction."
+        )
+    if decimal_separator == ",":
+        candidate = amount.replace(".", "").replace(",", ".")
+    else:
+        candidate = amount
+    if not regex.match(candidate):
+        return ValidationIssue(
+            "CSV006",
+            f"Row {idx}: amount '{amount}' is not formatted correctly",
+            f"Use two decimal places (e.g., 1234{decimal_separator}56) and remove currency symbols."
+        )
+    return None
 
 
-def validate_debit_credit(rows: List[Dict[str, str]], allowed: Iterable[str]) -> List[ValidationIssue]:
-    allowed_set = {value.lower() for value in allowed}
-    issues: List[ValidationIssue] = []
-    for idx, row in enumerate(rows, start=2):
-        value = row.get("debit_credit", "").strip().lower()
-        if value not in allowed_set:
-            issues.append(
-                ValidationIssue(
-                    "CSV008",
-                    f"Row {idx}: debit_credit '{row.get('debit_credit', '')}' is not one of {', '.join(allowed)}",
-                    "Set to 'debit' for money out and 'credit' for money in."
-                )
-            )
-    return issues
+def check_debit_credit(idx: int, row: Dict[str, str], allowed: List[str]) -> Optional[ValidationIssue]:
+    value = row.get("debit_credit", "").strip().lower()
+    if value in (item.lower() for item in allowed):
+        return None
+    return ValidationIssue(
+        "CSV008",
+        f"Row {idx}: debit_credit '{row.get('debit_credit', '')}' is not one of {', '.join(allowed)}",
+        "Set to 'debit' for money out and 'credit' for money in."
+    )
 
 
-def validate_currency(rows: List[Dict[str, str]], allowed: Iterable[str]) -> List[ValidationIssue]:
-    allowed_set = set(allowed)
-    issues: List[ValidationIssue] = []
-    for idx, row in enumerate(rows, start=2):
-        value = row.get("currency", "").strip().upper()
-        if value and value not in allowed_set:
-            issues.append(
-                ValidationIssue(
-                    "CSV022",
-                    f"Row {idx}: currency '{value}' is outside the allowed list",
-                    f"Stick to {', '.join(sorted(allowed_set))}. Separate files per currency."
-                )
-            )
-    return issues
+def check_currency(idx: int, row: Dict[str, str], allowed_set: set) -> Optional[ValidationIssue]:
+    value = row.get("currency", "").strip().upper()
+    if value and value not in allowed_set:
+        return ValidationIssue(
+            "CSV022",
+            f"Row {idx}: currency '{value}' is outside the allowed list",
+            f"Stick to {', '.join(sorted(allowed_set))}. Separate files per currency."
+        )
+    return None
 
 
-def validate_unique_ids(rows: List[Dict[str, str]]) -> List[ValidationIssue]:
-    ids = [row.get("unique_id", "").strip() for row in rows]
-    duplicates = [item for item, count in Counter(ids).items() if item and count > 1]
+def duplicate_id_issues(duplicates: List[str]) -> List[ValidationIssue]:
     if not duplicates:
         return []
     dup_display = ", ".join(duplicates[:3]) + ("…" if len(duplicates) > 3 else "")
@@ -174,6 +195,212 @@ def validate_unique_ids(rows: List[Dict[str, str]]) -> List[ValidationIssue]:
     ]
 
 
+def normalise_description(text: str) -> str:
+    return " ".join(re.sub(r"[^0-9a-z]+", " ", text.casefold()).split())
+
+
+class NearDuplicateIndex:
+    """Hash index on (date, amount in cents, direction) for spotting re-exported transactions.
+
+    Each bucket maps a normalised description to the first row that used it, so a row
+    costs one dictionary lookup per day in the ±window_days range and a whole file is
+    checked in linear time, even when thousands of rows share a date and amount.
+    """
+
+    def __init__(self, date_formats: Iterable[str], decimal_separator: str = ".", window_days: int = 0) -> None:
+        self.date_formats = [date_formats] if isinstance(date_formats, str) else list(date_formats)
+        self.decimal_separator = decimal_separator
+        self.window_days = window_days
+        self.buckets: Dict[Tuple[int, int, str], Dict[str, int]] = defaultdict(dict)
+
+    def _day(self, raw: str) -> Optional[int]:
+        for fmt in self.date_formats:
+            try:
+                return datetime.strptime(raw, fmt).toordinal()
+            except ValueError:
+                continue
+        return None
+
+    def _cents(self, raw: str) -> Optional[int]:
+        if self.decimal_separator == ",":
+            raw = raw.replace(".", "").replace(",", ".")
+        else:
+            raw = raw.replace(",", "")
+        try:
+            value = Decimal(raw)
+        except InvalidOperation:
+            return None
+        if not value.is_finite():
+            return None  # NaN and Infinity are reported by the amount check
+        return int((value * 100).to_integral_value())
+
+    def add(self, idx: int, row: Dict[str, str]) -> Optional[ValidationIssue]:
+        """Index one row and return an issue if it repeats an earlier one."""
+        day = self._day(row.get("transaction_date", "").strip())
+        cents = self._cents(row.get("amount", "").strip())
+        direction = row.get("debit_credit", "").strip().lower()
+        if day is None or cents is None:
+            return None  # Already reported by the date and amount checks
+        description = normalise_description(row.get("description", ""))
+
+        match = None
+        for offset in range(-self.window_days, self.window_days + 1):
+            bucket = self.buckets.get((day + offset, cents, direction))
+            earlier_idx = bucket.get(description) if bucket else None
+            if earlier_idx is not None and (match is None or earlier_idx < match):
+                match = earlier_idx
+        self.buckets[(day, cents, direction)].setdefault(description, idx)
+        if match is None:
+            return None
+        return ValidationIssue(
+            "CSV011",
+            f"Rows {match} and {idx} look like the same transaction ('{row.get('description', '').strip()}')",
+            "Date, amount, debit/credit and description all match, which usually means overlapping statement exports. Remove the repeated row before importing."
+        )
+
+
+class StreamValidator:
+    """Runs every check row by row so callers can validate while they stream.
+
+    Row dicts are not retained, but the duplicate checks must remember what they've
+    seen: CSV010 keeps every unique_id and, when duplicate_window is set, CSV011 keeps
+    one entry per distinct (date, amount, direction, description), so memory grows with
+    the number of transactions. Issues are grouped by check, in the order they're reported.
+
+    CSV011 is opt-in (duplicate_window=None turns it off) because genuine repeats such as
+    two identical coffees on the same day would otherwise fail the file.
+    """
+
+    def __init__(
+        self, config: Dict[str, Any], profile: Dict[str, Any], duplicate_window: Optional[int] = None
+    ) -> None:
+        self.config = config
+        self.date_formats = profile.get("date_format", [])
+        self.decimal_separator = profile.get("decimal_separator", ".")
+        self.amount_regex = re.compile(config["amount_pattern"])
+        self.allowed_debit_credit = list(config["allowed_debit_credit"])
+        self.allowed_currency = set(profile.get("currency", []))
+        self.near_duplicates = (
+            NearDuplicateIndex(self.date_formats, self.decimal_separator, duplicate_window)
+            if duplicate_window is not None
+            else None
+        )
+        self.groups: List[List[ValidationIssue]] = [[] for _ in range(5)]
+        self.seen_ids: set = set()
+        self.duplicate_ids: Dict[str, None] = {}
+        self.count = 0
+
+    def add(self, idx: int, row: Dict[str, str]) -> None:
+        self.count += 1
+        checks = (
+            check_date(idx, row, self.date_formats),
+            check_amount(idx, row, self.amount_regex, self.decimal_separator),
+            check_debit_credit(idx, row, self.allowed_debit_credit),
+            check_currency(idx, row, self.allowed_currency),
+            self.near_duplicates.add(idx, row) if self.near_duplicates else None,
+        )
+        for group, issue in zip(self.groups, checks):
+            if issue:
+                group.append(issue)
+        unique_id = row.get("unique_id", "").strip()
+        if unique_id in self.seen_ids:
+            self.duplicate_ids[unique_id] = None
+        elif unique_id:
+            self.seen_ids.add(unique_id)
+
+    def issues(self, fieldnames: Iterable[str]) -> List[ValidationIssue]:
+        dates, amounts, directions, currencies, repeats = self.groups
+        issues = check_columns(fieldnames, self.config)
+        issues.extend(dates + amounts + directions + currencies)
+        issues.extend(duplicate_id_issues(list(self.duplicate_ids)))
+        issues.extend(repeats)
+        return issues
+
+
+def scan_rows(
+    reader: csv.DictReader, config: Dict[str, Any], profile: Dict[str, Any], duplicate_window: Optional[int] = None
+) -> Tuple[int, List[ValidationIssue]]:
+    """Run every check in a single pass without keeping the rows (see StreamValidator for memory use)."""
+    validator = StreamValidator(config, profile, duplicate_window)
+    for idx, row in enumerate(reader, start=2):
+        validator.add(idx, row)
+    if not validator.count:
+        return 0, []
+    return validator.count, validator.issues(reader.fieldnames or [])
+
+
+def validate_member(
+    archive_path: Path, member: str, config: Dict[str, Any], profile: Dict[str, Any], duplicate_window: Optional[int] = None
+) -> List[ValidationIssue]:
+    """Validate one CSV inside a zip; read problems become issues so other members still run."""
+    try:
+        with zipfile.ZipFile(archive_path) as archive, open_member(archive, member) as handle:
+            count, issues = scan_rows(csv.DictReader(handle), config, profile, duplicate_window)
+    except READ_ERRORS as exc:
+        return [ValidationIssue("CSV017", unreadable_message(exc), "Export the file again and rebuild the zip.")]
+    except NotImplementedError:
+        return [
+            ValidationIssue(
+                "CSV017",
+                "This file uses a zip compression method Python can’t read",
+                "Rebuild the zip with your system’s standard “Compress” option."
+            )
+        ]
+    except RuntimeError:  # zipfile's "is encrypted, password required"
+        return [
+            ValidationIssue(
+                "CSV017",
+                "This file is password-protected",
+                "Rebuild the zip without a password so the statements can be read."
+            )
+        ]
+    if not count:
+        return [ValidationIssue("CSV000", "The CSV is empty", "Export a fresh file or download a sample from the Releases tab.")]
+    return issues
+
+
+def validate_archive(
+    archive_path: Path,
+    config: Dict[str, Any],
+    profile: Dict[str, Any],
+    duplicate_window: Optional[int] = None,
+    workers: int | None = None,
+) -> List[Tuple[str, List[ValidationIssue]]]:
+    """Validate every CSV member of a zip, spreading members across processes."""
+    try:
+        members = list_csv_members(archive_path)
+    except FileNotFoundError:
+        sys.exit(f"We couldn’t find {archive_path}. Drag & drop the file onto this script or run it again with the correct path.")
+    except READ_ERRORS as exc:
+        sys.exit(unreadable_message(exc))
+    if not members:
+        sys.exit("The zip doesn’t contain any CSV files. Add the statements and try again.")
+
+    if len(members) == 1 or workers == 1:
+        return [(member, validate_member(archive_path, member, config, profile, duplicate_window)) for member in members]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            (member, pool.submit(validate_member, archive_path, member, config, profile, duplicate_window))
+            for member in members
+        ]
+        return [(member, future.result()) for member, future in futures]
+
+
+def validate_file(
+    path: Path, config: Dict[str, Any], profile: Dict[str, Any], duplicate_window: Optional[int] = None
+) -> List[ValidationIssue]:
+    try:
+        with open_input(path) as handle:
+            count, issues = scan_rows(csv.DictReader(handle), config, profile, duplicate_window)
+    except FileNotFoundError:
+        sys.exit(f"We couldn’t find {path}. Drag & drop the file onto this script or run it again with the correct path.")
+    except READ_ERRORS as exc:
+        sys.exit(unreadable_message(exc))
+    if not count:
+        sys.exit("The CSV is empty. Export a fresh file or download a sample from the Releases tab.")
+    return issues
+
+
 def summarise(issues: List[ValidationIssue], profile_label: str, file_path: Path) -> None:
     if not issues:
         print("✅ All good! This file matches the ConvertMyStatements checks.")
@@ -197,6 +424,28 @@ def summarise(issues: List[ValidationIssue], profile_label: str, file_path: Path
     sys.exit(1)
 
 
+def summarise_archive(results: List[Tuple[str, List[ValidationIssue]]], profile_label: str, file_path: Path) -> None:
+    failing = [(member, issues) for member, issues in results if issues]
+    print(f"Checked {len(results)} CSV file(s) inside {file_path.name}")
+    print(f"Profile: {profile_label}")
+    print("")
+    for member, issues in results:
+        print(f"{'⚠️' if issues else '✅'} {member}")
+        for issue in issues:
+            print(f"    • [{issue.code}] {issue.message}\n        ↳ {issue.hint}")
+    print("")
+    if not failing:
+        print("✅ All good! Every file in this bundle matches the ConvertMyStatements checks.")
+        return
+
+    print(f"⚠️ {len(failing)} of {len(results)} file(s) need attention before importing.")
+    print("Download a fresh sample or use the hosted validator for step-by-step guidance:")
+    print(CTA_LINK)
+
+    # Exit with non-zero code for automation contexts
+    sys.exit(1)
+
+
 def prompt_for_file() -> Path:
     try:
         answer = input("Drag & drop your CSV here (or type the path) and press Enter:\n> ").strip().strip('"')
@@ -207,16 +456,38 @@ def prompt_for_file() -> Path:
     return Path(answer)
 
 
+def duplicate_window_for(args: argparse.Namespace) -> Optional[int]:
+    """None unless near-duplicate checks were asked for; --duplicate-window implies --check-duplicates."""
+    if args.duplicate_window is not None:
+        return args.duplicate_window
+    return 0 if args.check_duplicates else None
+
+
 def main(argv: List[str] | None = None) -> None:
     parser = argparse.ArgumentParser(
         description="Validate bank statement CSVs before importing them into your accounting software.",
         add_help=True,
     )
-    parser.add_argument("csv_path", nargs="?", help="Path to the CSV file you want to check")
+    parser.add_argument(
+        "csv_path", nargs="?", help="Path to the CSV file you want to check (.csv, .csv.gz/.bz2/.xz, or a .zip of CSVs)"
+    )
     parser.add_argument("--profile", default="quickbooks-us", help="Validation profile (defaults to quickbooks-us)")
     parser.add_argument("--config", default=str(CONFIG_DEFAULT), help="Override the config file path if needed")
+    parser.add_argument(
+        "--check-duplicates",
+        action="store_true",
+        help="Also flag rows with the same date, amount, debit/credit and description (CSV011)",
+    )
+    parser.add_argument(
+        "--duplicate-window",
+        type=duplicate_window_days,
+        default=None,
+        help=f"With --check-duplicates, also flag look-alikes up to this many days apart (0-{MAX_DUPLICATE_WINDOW}, defaults to same day only)",
+    )
+    parser.add_argument("--jobs", type=positive_int, default=None, help="Parallel workers for zip bundles (defaults to CPU count)")
 
     args = parser.parse_args(argv)
+    window = duplicate_window_for(args)
 
     csv_path = Path(args.csv_path) if args.csv_path else prompt_for_file()
     config_path = Path(args.config)
@@ -229,17 +500,15 @@ def main(argv: List[str] | None = None) -> None:
         sys.exit(f"Unknown profile '{profile_key}'. Available options: {available}")
 
     profile = profiles[profile_key]
-    rows = read_csv(csv_path)
+    label = profile.get("label", profile_key)
 
-    issues: List[ValidationIssue] = []
-    issues.extend(ensure_columns(rows, config))
-    issues.extend(validate_dates(rows, profile.get("date_format", [])))
-    issues.extend(validate_amounts(rows, config["amount_pattern"], profile.get("decimal_separator", ".")))
-    issues.extend(validate_debit_credit(rows, config["allowed_debit_credit"]))
-    issues.extend(validate_currency(rows, profile.get("currency", [])))
-    issues.extend(validate_unique_ids(rows))
-
-    summarise(issues, profile.get("label", profile_key), csv_path)
+    if csv_path.suffix.lower() == ".zip":
+        results = validate_archive(csv_path, config, profile, window, args.jobs)
+        summarise_archive(results, label, csv_path)
+        return
+
+    issues = validate_file(csv_path, config, profile, window)
+    summarise(issues, label, csv_path)
 
 
 if __name__ == "__main__":